@@ -1,30 +1,43 @@
 import argparse
-import logging
+import functools
 import os
 import sys
 from importlib.metadata import distribution
 
 from . import constants as C
+from .utils._log import getLogger
 
-logger = logging.getLogger(__name__)
+logger = getLogger(__name__)
+
+_APP_LOWER = C.APP_NAME.lower()
+_APP_PREFIX = f"{_APP_LOWER}-"
 
 
 def _short_name(name: str):
-    app_name = f"{C.APP_NAME.lower()}"
-    return name.removeprefix(f"{app_name}-").replace(f"{app_name}", "help")
+    return "help" if name == _APP_LOWER else name.removeprefix(_APP_PREFIX)
 
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _ep_map():
+    """Map short command names to the app's console_scripts entry points"""
     dist = distribution(C.APP_NAME)
-    ep_map = {
+    return {
         _short_name(ep.name): ep
-        for ep in dist.entry_points
-        if ep.group == "console_scripts"
+        for ep in dist.entry_points.select(group="console_scripts")
     }
 
-    parser = argparse.ArgumentParser(
-        prog=f"python -m {C.APP_NAME.lower()}", add_help=False
-    )
+
+def main():
+    ep_map = _ep_map()
+
+    # fast path: `python -m srn <command> ...`, load just that entry point
+    if len(sys.argv) > 1 and sys.argv[1] in ep_map:
+        _main = ep_map[sys.argv[1]].load()
+        _main(sys.argv[1:])
+        return
+
+    # otherwise let argparse report usage/choices
+    parser = argparse.ArgumentParser(prog=f"python -m {_APP_LOWER}", add_help=False)
     parser.add_argument("entry_point", choices=list(ep_map))
     args, extra = parser.parse_known_args()
 
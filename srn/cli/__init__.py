@@ -11,6 +11,7 @@ if sys.version_info < (3, 10):
     )
 
 import errno
+import functools
 import traceback
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -23,6 +24,7 @@ except Exception as e:
 
 from ..exceptions import AppError, ConfigurationError
 from ..release import __version__
+from ..utils._log import VERBOSE, getLogger, start_log_listener
 from .arguments import option_helpers as opt_help
 
 try:
@@ -32,7 +34,24 @@ try:
 except ImportError:
     HAS_ARGCOMPLETE = False
 
-logger = logging.getLogger(__name__)
+logger = getLogger(__name__)
+
+
+@functools.cache
+def _parse_version(app_version):
+    """split a dotted version into a (major, minor, revision) tuple"""
+    app_versions = app_version.split(".")
+    for counter in range(len(app_versions)):
+        if app_versions[counter] == "":
+            app_versions[counter] = 0
+        try:
+            app_versions[counter] = int(app_versions[counter])
+        except Exception:
+            pass
+    if len(app_versions) < 3:
+        for counter in range(len(app_versions), 3):
+            app_versions.append(0)
+    return tuple(app_versions[:3])
 
 
 class CLIArgs(dict):
@@ -41,10 +60,7 @@ class CLIArgs(dict):
     """
 
     def __init__(self, mapping):
-        toplevel = {}
-        for key, value in mapping.items():
-            toplevel[key] = value
-        super(CLIArgs, self).__init__(toplevel)
+        super(CLIArgs, self).__init__(mapping)
 
     @classmethod
     def from_mapping(cls, mapping):
@@ -75,27 +91,32 @@ class CLI(ABC):
 
         self.parse()
 
-        logger.debug(opt_help.version(self.parser.prog))
+        # version() reads git metadata from disk, only build it when needed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(opt_help.version(self.parser.prog))
 
-        if C.CONFIG_FILE:
-            logger.verbose("Using %s as config file" % C.CONFIG_FILE)
-        else:
-            logger.verbose("No config file found; using defaults")
+        if logger.isEnabledFor(VERBOSE):
+            if C.CONFIG_FILE:
+                logger.verbose("Using %s as config file", C.CONFIG_FILE)
+            else:
+                logger.verbose("No config file found; using defaults")
 
         # warn about deprecated config options
-        try:
-            for deprecated in C.config.DEPRECATED:
-                name = deprecated[0]
-                why = deprecated[1]["why"]
-                if "alternatives" in deprecated[1]:
-                    alt = ", use %s instead" % deprecated[1]["alternatives"]
-                else:
-                    alt = ""
-                ver = deprecated[1].get("version")  # noqa: F841
-                date = deprecated[1].get("date")  # noqa: F841
-                logger.warn("%s option, %s%s" % (name, why, alt))
-        except AttributeError:
-            return
+        if logger.isEnabledFor(logging.WARNING):
+            try:
+                for deprecated in C.config.DEPRECATED:
+                    name = deprecated[0]
+                    why = deprecated[1]["why"]
+                    if "alternatives" in deprecated[1]:
+                        alt = ", use %s instead" % deprecated[1]["alternatives"]
+                    else:
+                        alt = ""
+                    ver = deprecated[1].get("version")  # noqa: F841
+                    date = deprecated[1].get("date")  # noqa: F841
+                    logger.warning("%s option, %s%s", name, why, alt)
+            except AttributeError:
+                # no config loaded, nothing to warn about
+                pass
 
     @abstractmethod
     def init_parser(self, usage="", desc=None, epilog=None):
@@ -172,23 +193,13 @@ class CLI(ABC):
         else:
             app_version_string = __version__
         app_version = app_version_string.split()[0]
-        app_versions = app_version.split(".")
-        for counter in range(len(app_versions)):
-            if app_versions[counter] == "":
-                app_versions[counter] = 0
-            try:
-                app_versions[counter] = int(app_versions[counter])
-            except Exception:
-                pass
-        if len(app_versions) < 3:
-            for counter in range(len(app_versions), 3):
-                app_versions.append(0)
+        major, minor, revision = _parse_version(app_version)
         return {
             "string": app_version_string.strip(),
             "full": app_version,
-            "major": app_versions[0],
-            "minor": app_versions[1],
-            "revision": app_versions[2],
+            "major": major,
+            "minor": minor,
+            "revision": revision,
         }
 
     @classmethod
@@ -197,6 +208,7 @@ class CLI(ABC):
             args = sys.argv
 
         try:
+            start_log_listener()
             logger.debug("starting run")
 
             app_dir = Path(C.APP_HOME).expanduser()
@@ -208,7 +220,7 @@ class CLI(ABC):
                         "Failed to create the directory '%s': %s" % (app_dir, exc)
                     )
             else:
-                logger.debug("Created the '%s' directory" % app_dir)
+                logger.debug("Created the '%s' directory", app_dir)
 
             cli = cls(args)
             exit_code = cli.run()
@@ -238,11 +250,11 @@ class CLI(ABC):
                 and cli.cli_args["verbosity"] > 2
             ):
                 log_only = False
-                if hasattr(e, "orig_exc"):
+                if hasattr(e, "orig_exc") and logger.isEnabledFor(VERBOSE):
                     toe = type(e.orig_exc)
-                    logger.verbose(f"\nexception type: {toe}")  # noqa: F821
+                    logger.verbose("\nexception type: %s", toe)  # noqa: F821
                     if e != e.orig_exc:
-                        logger.verbose("\noriginal msg: %s" % e.orig_exc)  # noqa: F821
+                        logger.verbose("\noriginal msg: %s", e.orig_exc)  # noqa: F821
             else:
                 print("to see the full traceback")
                 log_only = True
@@ -3,42 +3,45 @@ __metaclass__ = type
 
 
 import argparse
-import copy
+import functools
 import operator
 import os
 import os.path
 import sys
 import time
-
-import srn as app
+from pathlib import Path
 
 from ... import constants as C
 from ...release import __version__
 from ...utils.misc import unfrackpath
-from ...utils.yaml import yaml_load
+
+# source checkout root, used to report git info for development installs
+_BASEDIR = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")
+)
+_REPO_PATH = os.path.join(_BASEDIR, ".git")
 
 
 #
 # Special purpose OptionParsers
 #
 class SortingHelpFormatter(argparse.HelpFormatter):
+    # add_arguments() (and so this sort) only runs when help or usage is
+    # formatted, not on a regular invocation
     def add_arguments(self, actions):
         actions = sorted(actions, key=operator.attrgetter("option_strings"))
         super(SortingHelpFormatter, self).add_arguments(actions)
 
 
+_MULTIPLE_HELP = "This argument may be specified multiple times."
+
+
 class ArgumentParser(argparse.ArgumentParser):
     def add_argument(self, *args, **kwargs):
         action = kwargs.get("action")
         help = kwargs.get("help")
-        if help and action in {
-            "append",
-            "append_const",
-            "count",
-            "extend",
-            PrependListAction,
-        }:
-            help = f'{help.rstrip(".")}. This argument may be specified multiple times.'
+        if help and action in _MULTI_ACTIONS and not help.endswith(_MULTIPLE_HELP):
+            help = f'{help.rstrip(".")}. {_MULTIPLE_HELP}'
         kwargs["help"] = help
         return super().add_argument(*args, **kwargs)
 
@@ -116,11 +119,17 @@ class PrependListAction(argparse.Action):
         )
 
     def __call__(self, parser, namespace, values, option_string=None):
-        items = copy.copy(ensure_value(namespace, self.dest, []))
+        items = ensure_value(namespace, self.dest, [])[:]
         items[0:0] = values
         setattr(namespace, self.dest, items)
 
 
+# actions that accept the same option more than once
+_MULTI_ACTIONS = frozenset(
+    {"append", "append_const", "count", "extend", PrependListAction}
+)
+
+
 def ensure_value(namespace, name, value):
     if getattr(namespace, name, None) is None:
         setattr(namespace, name, value)
@@ -154,6 +163,7 @@ def maybe_unfrack_path(beacon):
     return inner
 
 
+@functools.lru_cache(maxsize=1)
 def _git_repo_info(repo_path):
     """returns a string containing git branch, commit id and commit date"""
     result = None
@@ -162,25 +172,31 @@ def _git_repo_info(repo_path):
         # a submodule structure.
         if os.path.isfile(repo_path):
             try:
+                # the .git file is a single "gitdir: <path>" line
+                gitdir = None
                 with open(repo_path) as f:
-                    gitdir = yaml_load(f).get("gitdir")
+                    for line in f:
+                        if line.startswith("gitdir:"):
+                            gitdir = line.split(":", 1)[1].strip()
+                            break
+                if gitdir is None:
+                    return ""
                 # There is a possibility the .git file to have an absolute path.
                 if os.path.isabs(gitdir):
                     repo_path = gitdir
                 else:
                     repo_path = os.path.join(repo_path[:-4], gitdir)
-            except (IOError, AttributeError):
+            except IOError:
                 return ""
-        with open(os.path.join(repo_path, "HEAD")) as f:
-            line = f.readline().rstrip("\n")
-            if line.startswith("ref:"):
-                branch_path = os.path.join(repo_path, line[5:])
-            else:
-                branch_path = None
+        # refs are tiny ASCII files, read them in one go
+        line = Path(repo_path, "HEAD").read_bytes().split(b"\n", 1)[0].decode()
+        if line.startswith("ref:"):
+            branch_path = os.path.join(repo_path, line[5:])
+        else:
+            branch_path = None
         if branch_path and os.path.exists(branch_path):
             branch = "/".join(line.split("/")[2:])
-            with open(branch_path) as f:
-                commit = f.readline()[:10]
+            commit = Path(branch_path).read_bytes()[:10].decode()
         else:
             # detached HEAD
             commit = line[:10]
@@ -203,16 +219,15 @@ def _git_repo_info(repo_path):
     return result
 
 
+@functools.lru_cache(maxsize=1)
 def _gitinfo():
-    basedir = os.path.normpath(
-        os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")
-    )
-    repo_path = os.path.join(basedir, ".git")
-    return _git_repo_info(repo_path)
+    return _git_repo_info(_REPO_PATH)
 
 
 def version(prog=None):
     """return app version"""
+    import srn as _app
+
     if prog:
         result = ["{0} [core {1}]".format(prog, __version__)]
     else:
@@ -222,7 +237,7 @@ def version(prog=None):
     if gitinfo:
         result[0] = "{0} {1}".format(result[0], gitinfo)
     result.append("  config file = %s" % C.CONFIG_FILE)
-    result.append("  app python module location = %s" % ":".join(app.__path__))
+    result.append("  app python module location = %s" % ":".join(_app.__path__))
     result.append("  executable location = %s" % sys.argv[0])
     result.append(
         "  python version = %s (%s)"
@@ -3,7 +3,7 @@ import subprocess
 import logging
 import importlib
 import typing as t
-from contextlib import contextmanager
+from functools import lru_cache
 
 from .release import __version__
 
@@ -24,16 +24,6 @@ def _deprecated(msg, version):
 
 
 # git parse functions
-@contextmanager
-def change_directory(new_directory):
-    original_directory = os.getcwd()
-    try:
-        os.chdir(new_directory)
-        yield
-    finally:
-        os.chdir(original_directory)
-
-
 def get_package_path(package_name):
     try:
         package = importlib.import_module(package_name)
@@ -49,25 +39,31 @@ def get_last_commit_sha(package_name):
     package_path = get_package_path(package_name)
     if package_path:
         try:
-            with change_directory(package_path):
-                # Get the SHA of the last commit
-                sha = (
-                    subprocess.check_output(
-                        ["git", "rev-parse", "HEAD"], stderr=subprocess.STDOUT
-                    )
-                    .decode("utf-8")
-                    .strip()
+            # Get the SHA of the last commit
+            sha = (
+                subprocess.check_output(
+                    ["git", "rev-parse", "HEAD"],
+                    cwd=package_path,
+                    stderr=subprocess.STDOUT,
                 )
-                return sha
+                .decode("utf-8")
+                .strip()
+            )
+            return sha
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             logger.debug(f"Error: {e}")
             return None
 
 
+@lru_cache(maxsize=1)
+def version_sha():
+    """SHA of the last commit, resolved on first use (spawns git)"""
+    return get_last_commit_sha(APP_NAME)
+
+
 # CONSTANTS ### yes, actual ones
 APP_NAME = "srn"
 VERSION_STRING = __version__
-VERSION_SHA = get_last_commit_sha(APP_NAME)
 
 APP_HOME = "~/.srn"
 CONFIG_FILE = None
@@ -76,6 +72,8 @@ DEFAULT_LOG_FILTER: t.List[t.Any] = []
 DEFAULT_LOG_PATH = "srn.log"
 DEFAULT_VERBOSITY = 0
 LOG_BACKUP_COUNT = 30
+LOG_BUFFER_CAPACITY = 1024
+LOG_FLUSH_INTERVAL = 30
 LOG_FORMAT = "[%(asctime)s] %(levelname)s %(module)s:%(message)s"
 LOG_INTERVAL = 1
 LOG_LEVEL = "ERROR"
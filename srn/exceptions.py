@@ -11,11 +11,14 @@ if TYPE_CHECKING:
     pass
 
 
+_KEBAB_RE = re.compile(r"^[a-z]+(?:-[a-z]+)*\Z")
+
+
 #
 # Scaffolding
 #
 def _is_kebab_case(s: str) -> bool:
-    return re.match(r"^[a-z]+(-[a-z]+)*$", s) is not None
+    return _KEBAB_RE.match(s) is not None
 
 
 class AppError(Exception):
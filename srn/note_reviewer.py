@@ -5,15 +5,36 @@ import datetime
 import typing as t
 
 from schema import Use, And, SchemaError
-from fsrs import FSRS, Card, ReviewLog
-import logging
+from fsrs import FSRS, Card
 
-logger = logging.getLogger(__name__)
+from .utils._log import getLogger
+
+logger = getLogger(__name__)
 
 
 difficulty_schema = And(Use(int), lambda n: 1 <= n <= 4)
 
 
+def _iter_notes(path: str) -> t.Iterator[str]:
+    """Yield the paths of all markdown notes under path, recursively"""
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir():
+                    # like os.walk(followlinks=False): symlinked dirs are
+                    # listed as dirs but not descended into
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    yield entry.path
+    except OSError:
+        # unreadable directory, skip it like os.walk does
+        return
+    for subdir in subdirs:
+        yield from _iter_notes(subdir)
+
+
 class NoteReviewer:
     def __init__(self, notes_path: str, review_log_file: t.Optional[str]):
         self.notes_path = os.path.expanduser(notes_path)
@@ -30,20 +51,19 @@ class NoteReviewer:
         else:
             self.review_log = {}
 
-    def select_notes_for_review(self, q: int = 5):
-        notes = [
-            os.path.join(root, file)
-            for root, _, files in os.walk(self.notes_path)
-            for file in files
-            if file.endswith(".md")
-        ]
+        # parsed cards keyed by note, so the review loop works on Card objects
+        # and only notes reviewed in this session are serialized back on save
+        self._cards: t.Dict[str, Card] = {
+            note: Card.from_dict(data["card"]) for note, data in self.review_log.items()
+        }
+        self._updated: t.Set[str] = set()
 
+    def select_notes_for_review(self, q: int = 5):
+        now = datetime.datetime.now().timestamp()
         notes_due = []
-        for note in notes:
-            if note in self.review_log:
-                card_data = self.review_log[note]
-                card = Card.from_dict(card_data["card"])
-                if card.due.timestamp() <= datetime.datetime.now().timestamp():
+        for note in _iter_notes(self.notes_path):
+            if note in self._cards:
+                if self._cards[note].due.timestamp() <= now:
                     notes_due.append(note)
             else:
                 notes_due.append(note)  # New notes to be reviewed
@@ -52,28 +72,40 @@ class NoteReviewer:
 
     def update_review_log(self, note, rating):
         today = datetime.date.today().strftime("%Y-%m-%d")
-        if note in self.review_log:
-            card_data = self.review_log[note]
-            card = Card.from_dict(card_data["card"])
-            review_log = ReviewLog.from_dict(card_data["review_log"])
-        else:
-            card = Card()
+        card = self._cards.get(note) or Card()
 
         # Update the card and review log using the review_card method with the given rating
         card, review_log = self.fsrs.review_card(card, rating)
 
+        self._cards[note] = card
+        self._updated.add(note)
         self.review_log[note] = {
             "last_reviewed": today,
-            "card": card.to_dict(),
             "review_log": review_log.to_dict(),
         }
 
     def save_review_log(self):
-        with open(self.review_log_file, "w") as f:
+        for note in self._updated:
+            self.review_log[note]["card"] = self._cards[note].to_dict()
+        self._updated.clear()
+
+        # write to a sibling temp file and swap it in, so an interrupted
+        # save never leaves a truncated review log behind
+        tmp_file = self.review_log_file + ".tmp"
+        with open(tmp_file, "w") as f:
             json.dump(self.review_log, f, indent=4)
+        os.replace(tmp_file, self.review_log_file)
 
     def review_notes(self):
         notes_for_review = self.select_notes_for_review()
+        try:
+            self._review(notes_for_review)
+        finally:
+            # only touch the file when something was rated this session
+            if self._updated:
+                self.save_review_log()
+
+    def _review(self, notes_for_review):
         finish_review = False
         for note in notes_for_review:
             while True:
@@ -102,4 +134,3 @@ class NoteReviewer:
             else:
                 rating = 5 - difficulty
                 self.update_review_log(note, rating)
-                self.save_review_log()
@@ -7,17 +7,29 @@ init_logging() must be called before any other modules that call logging.getLogg
 
 # mypy: disable-error-code = attr-defined
 
+import atexit
+import functools
 import logging
+import queue
 import sys
+import time
 from abc import ABC, abstractmethod
-from logging.handlers import TimedRotatingFileHandler
-from typing import Any, cast
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    TimedRotatingFileHandler,
+)
+from typing import Any, Optional, cast
 
 from .. import constants as C
 
 # custom log level for `--verbose` output, between DEBUG and INFO
 VERBOSE = 15
 
+_INITIALIZED = False
+_LISTENER: Optional[QueueListener] = None
+
 
 class VerboseLogger(logging.Logger):
     """
@@ -27,19 +39,35 @@ class VerboseLogger(logging.Logger):
     """
 
     def verbose(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        return self.log(VERBOSE, msg, *args, **kwargs)
+        # same fast path as Logger.debug()/info(): bail out before building
+        # a record, and call _log() directly to skip log()'s own level check
+        if self.isEnabledFor(VERBOSE):
+            self._log(VERBOSE, msg, args, **kwargs)
 
 
+@functools.cache
 def getLogger(name: str) -> VerboseLogger:
-    """logging.getLogger, but ensures our VerboseLogger class is returned"""
+    """logging.getLogger, but ensures our VerboseLogger class is returned
+
+    Memoized so callers never go through the logging manager lock twice for
+    the same name. Modules should still bind their logger once at import
+    time, i.e. ``logger = getLogger(__name__)``, rather than fetching it on
+    every call.
+    """
     return cast(VerboseLogger, logging.getLogger(name))
 
 
 def init_logging() -> None:
     """Register our VerboseLogger and VERBOSE log level.
 
-    Should be called before any calls to getLogger(),
+    Should be called before any calls to getLogger().
+    Calling it again is a no-op, so handlers are only attached once.
     """
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    _INITIALIZED = True
+
     DefaultLoggingConfigurator().configure()
     logging.setLoggerClass(VerboseLogger)
     logging.addLevelName(VERBOSE, "VERBOSE")
@@ -51,6 +79,85 @@ class LoggingConfigurator(ABC):  # pylint: disable=too-few-public-methods
         pass
 
 
+def _buffered(handler: logging.Handler) -> MemoryHandler:
+    """Wrap handler so records are emitted in batches.
+
+    Records are held until the buffer is full or one of level ERROR or
+    above arrives, which flushes immediately. Buffered records are
+    flushed at interpreter exit.
+    """
+    buffered = MemoryHandler(
+        C.LOG_BUFFER_CAPACITY,  # type: ignore[attr-defined]
+        flushLevel=logging.ERROR,
+        target=handler,
+        flushOnClose=True,
+    )
+    atexit.register(buffered.flush)
+    return buffered
+
+
+class FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers every ``flush_interval`` seconds.
+
+    Bounds how long a record can sit in a buffered handler, whether the queue
+    is busy or idle, without an extra thread.
+    """
+
+    def __init__(
+        self,
+        log_queue: Any,
+        *handlers: logging.Handler,
+        flush_interval: float,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(log_queue, *handlers, **kwargs)
+        self.flush_interval = flush_interval
+        self._flush_deadline = time.monotonic() + flush_interval
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            now = time.monotonic()
+            if now >= self._flush_deadline:
+                for handler in self.handlers:
+                    handler.flush()
+                self._flush_deadline = now + self.flush_interval
+            try:
+                return self.queue.get(block, timeout=max(0, self._flush_deadline - now))
+            except queue.Empty:
+                if not block:
+                    raise
+
+
+def start_log_listener() -> None:
+    """Move file logging onto a background QueueListener thread.
+
+    Called from the CLI entry point rather than at import, so importing the
+    package starts no threads. stderr output stays synchronous. Calling it
+    again is a no-op.
+    """
+    global _LISTENER
+    if _LISTENER is not None:
+        return
+    logger = logging.getLogger(C.APP_NAME)
+    file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+    if not file_handlers:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    for handler in file_handlers:
+        logger.removeHandler(handler)
+    _LISTENER = FlushingQueueListener(
+        log_queue,
+        *(_buffered(h) for h in file_handlers),
+        flush_interval=C.LOG_FLUSH_INTERVAL,  # type: ignore[attr-defined]
+        respect_handler_level=True,
+    )
+    _LISTENER.start()
+    # drain the queue at exit, before the buffered handlers flush
+    atexit.register(_LISTENER.stop)
+
+
 class DefaultLoggingConfigurator(LoggingConfigurator):
     def configure(self, debug_mode: bool = False) -> logging.Logger:
         logging.captureWarnings(capture=True)
@@ -61,7 +168,9 @@ class DefaultLoggingConfigurator(LoggingConfigurator):
         # create a formatter
         formatter = logging.Formatter(C.LOG_FORMAT)  # type: ignore[attr-defined]
 
-        # in production mode, add log handler to sys.stderr.
+        # in production mode, add log handler to sys.stderr. It stays
+        # unbuffered and on the calling thread so interactive output shows
+        # up immediately and in order with print()
         if not C.DEFAULT_DEBUG:  # type: ignore[attr-defined]
             stderr_handler = logging.StreamHandler(sys.stderr)
             stderr_handler.setFormatter(formatter)
@@ -76,6 +185,7 @@ class DefaultLoggingConfigurator(LoggingConfigurator):
                 backupCount=C.LOG_BACKUP_COUNT,
             )
             handler.setFormatter(formatter)
+            # moved behind a QueueListener by start_log_listener()
             logger.addHandler(handler)
 
         # add filters
@@ -1,17 +1,20 @@
 import contextlib
+import copy
 import errno
 import getpass
 import hashlib
 import io
+import ipaddress
 import json
 import os
+import re
 import shutil
 import stat
 import sys
+import time
 import urllib.parse
-from functools import partial
+from functools import lru_cache, partial
 from io import StringIO
-from itertools import filterfalse, tee, zip_longest
 from pathlib import Path
 from types import FunctionType, TracebackType
 from typing import (
@@ -32,8 +35,6 @@ from typing import (
     cast,
 )
 
-from tenacity import retry, stop_after_delay, wait_fixed
-
 from ..exceptions import AppError, ConfigurationError
 from .virtualenv import running_under_virtualenv
 
@@ -59,16 +60,32 @@ OnExc = Callable[[FunctionType, Path, BaseException], Any]
 OnErr = Callable[[FunctionType, Path, ExcInfo], Any]
 
 
+@lru_cache(maxsize=64)
+def _load_json_file(filepath: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns and size are only part of the cache key, so an edited file
+    # is parsed again
+    with open(filepath, "r") as f:
+        return json.load(f)
+
+
+_load_json_content = lru_cache(maxsize=64)(json.loads)
+
+
 def _try_json_readkey(
     key: str, filepath: Optional[str] = None, content: Optional[str] = None
 ):
     try:
         if filepath is None and content:
-            _json = json.loads(content)
+            _json = _load_json_content(content)
         elif filepath:
-            with open(filepath, "r") as f:
-                _json = json.load(f)
-        return _json.get(key)
+            st = os.stat(filepath)
+            _json = _load_json_file(filepath, st.st_mtime_ns, st.st_size)
+        value = _json.get(key)
+        # the parsed document is cached and shared, never hand out its
+        # containers
+        if isinstance(value, (dict, list)):
+            value = copy.deepcopy(value)
+        return value
     except Exception:  # pylint: disable=broad-except
         return None
 
@@ -115,20 +132,35 @@ def normalize_version_info(py_version_info: Tuple[int, ...]) -> Tuple[int, int,
 def ensure_dir(path: str) -> None:
     """os.path.makedirs without EEXIST."""
     try:
-        os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
     except OSError as e:
         # Windows can raise spurious ENOTEMPTY errors. See #6426.
         if e.errno != errno.EEXIST and e.errno != errno.ENOTEMPTY:
             raise
 
 
-# Retry every half second for up to 3 seconds
-# Tenacity raises RetryError by default, explicitly raise the original exception
-@retry(reraise=True, stop=stop_after_delay(3), wait=wait_fixed(0.5))
 def rmtree(
     dir: str,
     ignore_errors: bool = False,
     onexc: Optional[OnExc] = None,
+) -> None:
+    # Retry every half second for up to 3 seconds, then re-raise the
+    # original exception. Kept inline so the common first-try success
+    # doesn't pay for a retry framework.
+    deadline = time.monotonic() + 3
+    while True:
+        try:
+            return _rmtree(dir, ignore_errors, onexc)
+        except Exception:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.5)
+
+
+def _rmtree(
+    dir: str,
+    ignore_errors: bool = False,
+    onexc: Optional[OnExc] = None,
 ) -> None:
     if ignore_errors:
         onexc = _onerror_ignore
@@ -200,16 +232,42 @@ def display_path(path: str) -> str:
     """Gives the display value for a given path, making it relative to cwd
     if possible."""
     path = os.path.normcase(os.path.abspath(path))
-    if path.startswith(os.getcwd() + os.path.sep):
-        path = "." + path[len(os.getcwd()) :]
+    cwd = os.getcwd()
+    if path.startswith(cwd + os.path.sep):
+        path = "." + path[len(cwd) :]
     return path
 
 
 def backup_dir(dir: str, ext: str = ".bak") -> str:
     """Figure out the name of a directory to back up the given dir to
     (adding .bak, .bak2, etc)"""
+    # list the parent once rather than stat-ing every candidate name
+    parent, base = os.path.split(dir)
+    prefix = base + ext
+    used = set()
+    try:
+        with os.scandir(parent or ".") as it:
+            for entry in it:
+                if not entry.name.startswith(prefix):
+                    continue
+                suffix = entry.name[len(prefix) :]
+                if not suffix:
+                    used.add(1)
+                elif (
+                    suffix.isascii()
+                    and suffix.isdigit()
+                    and suffix[0] != "0"
+                    and suffix != "1"
+                ):
+                    used.add(int(suffix))
+    except OSError:
+        pass
     n = 1
-    extension = ext
+    while n in used:
+        n += 1
+    # the scan is case-sensitive and may have failed; confirm the pick and
+    # probe onwards like before if it is taken after all
+    extension = ext + (str(n) if n > 1 else "")
     while os.path.exists(dir + extension):
         n += 1
         extension = ext + str(n)
@@ -233,11 +291,14 @@ def _check_no_input(message: str) -> None:
 
 def ask(message: str, options: Iterable[str]) -> str:
     """Ask the message interactively, with the given possible responses"""
+    options = tuple(options)
+    choices = frozenset(options)
     while 1:
         _check_no_input(message)
-        response = input(message)
-        response = response.strip().lower()
-        if response not in options:
+        response = input(message).strip()
+        if not (response.isascii() and response.islower()):
+            response = response.lower()
+        if response not in choices:
             print(
                 "Your response ({!r}) was not one of the expected responses: "
                 "{}".format(response, ", ".join(options))
@@ -258,6 +319,10 @@ def ask_password(message: str) -> str:
     return getpass.getpass(message)
 
 
+_TRUE_VALUES = frozenset(("y", "yes", "t", "true", "on", "1"))
+_FALSE_VALUES = frozenset(("n", "no", "f", "false", "off", "0"))
+
+
 def strtobool(val: str) -> int:
     """Convert a string representation of truth to true (1) or false (0).
 
@@ -265,24 +330,38 @@ def strtobool(val: str) -> int:
     are 'n', 'no', 'f', 'false', 'off', and '0'.  Raises ValueError if
     'val' is anything else.
     """
-    val = val.lower()
-    if val in ("y", "yes", "t", "true", "on", "1"):
+    if not val.islower():
+        val = val.lower()
+    if val in _TRUE_VALUES:
         return 1
-    elif val in ("n", "no", "f", "false", "off", "0"):
+    elif val in _FALSE_VALUES:
         return 0
     else:
         raise ValueError(f"invalid truth value {val!r}")
 
 
+_MB = 1000 * 1000
+_KB = 1000
+_WHOLE_KB_THRESHOLD = 10 * _KB
+
+
+def _tenths(size: int, unit: int) -> str:
+    """size / unit with one decimal, rounding half up, in integer math"""
+    q = (size + unit // 20) // (unit // 10)
+    return f"{q // 10}.{q % 10}"
+
+
 def format_size(bytes: float) -> str:
-    if bytes > 1000 * 1000:
-        return f"{bytes / 1000.0 / 1000:.1f} MB"
-    elif bytes > 10 * 1000:
-        return f"{int(bytes / 1000)} kB"
-    elif bytes > 1000:
-        return f"{bytes / 1000.0:.1f} kB"
+    # pick the unit from the original value, truncate only for formatting
+    size = int(bytes)
+    if bytes > _MB:
+        return f"{_tenths(size, _MB)} MB"
+    elif bytes > _WHOLE_KB_THRESHOLD:
+        return f"{size // _KB} kB"
+    elif bytes > _KB:
+        return f"{_tenths(size, _KB)} kB"
     else:
-        return f"{int(bytes)} bytes"
+        return f"{size} bytes"
 
 
 def tabulate(rows: Iterable[Iterable[Any]]) -> Tuple[List[str], List[int]]:
@@ -294,20 +373,31 @@ def tabulate(rows: Iterable[Iterable[Any]]) -> Tuple[List[str], List[int]]:
     (['foobar     2000', '3735928559'], [10, 4])
     """
     rows = [tuple(map(str, row)) for row in rows]
-    sizes = [max(map(len, col)) for col in zip_longest(*rows, fillvalue="")]
-    table = [" ".join(map(str.ljust, row, sizes)).rstrip() for row in rows]
+    # widest cell per column, in one pass over the rows
+    sizes = [0] * max(map(len, rows), default=0)
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > sizes[i]:
+                sizes[i] = len(cell)
+    # one format string for the whole layout; short rows are padded with
+    # empty cells, which the rstrip() drops again
+    fmt = " ".join(f"{{:<{size}}}" for size in sizes)
+    padding = ("",) * len(sizes)
+    table = [fmt.format(*row, *padding[len(row) :]).rstrip() for row in rows]
     return table, sizes
 
 
 def read_chunks(
     file: BinaryIO, size: int = io.DEFAULT_BUFFER_SIZE
-) -> Generator[bytes, None, None]:
-    """Yield pieces of data from a file-like object until EOF."""
-    while True:
-        chunk = file.read(size)
-        if not chunk:
-            break
-        yield chunk
+) -> Generator[memoryview, None, None]:
+    """Yield pieces of data from a file-like object until EOF.
+
+    The chunks are views over a single reused buffer, so each one is only
+    valid until the next is requested; copy it (``bytes(chunk)``) to keep it.
+    """
+    buf = memoryview(bytearray(size))
+    while n := file.readinto(buf):  # type: ignore[attr-defined]
+        yield buf[:n]
 
 
 def normalize_path(path: str, resolve_symlinks: bool = True) -> str:
@@ -315,6 +405,9 @@ def normalize_path(path: str, resolve_symlinks: bool = True) -> str:
     Convert a path to its canonical, case-normalized, absolute version.
 
     """
+    if not resolve_symlinks and not path.startswith("~") and os.path.isabs(path):
+        # abspath() of an absolute path is just normpath(), no getcwd() needed
+        return os.path.normcase(os.path.normpath(path))
     path = os.path.expanduser(path)
     if resolve_symlinks:
         path = os.path.realpath(path)
@@ -351,7 +444,12 @@ def is_local(path: str) -> bool:
     """
     if not running_under_virtualenv():
         return True
-    return path.startswith(normalize_path(sys.prefix))
+    return path.startswith(_normalized_prefix())
+
+
+@lru_cache(maxsize=1)
+def _normalized_prefix() -> str:
+    return normalize_path(sys.prefix)
 
 
 class StreamWrapper(StringIO):
@@ -434,13 +532,52 @@ def build_url_from_netloc(netloc: str, scheme: str = "https") -> str:
     return f"{scheme}://{netloc}"
 
 
+_IPV_FUTURE_RE = re.compile(r"\Av[a-fA-F0-9]+\..+\Z")
+
+
+def _check_bracketed_host(host: str) -> None:
+    # urlsplit() only accepts IPv6 (or IPvFuture) literals in brackets
+    if host.startswith("v"):
+        if not _IPV_FUTURE_RE.match(host):
+            raise ValueError("IPvFuture address is invalid")
+    elif isinstance(ipaddress.ip_address(host), ipaddress.IPv4Address):
+        raise ValueError("An IPv4 address cannot be in brackets")
+
+
 def parse_netloc(netloc: str) -> Tuple[Optional[str], Optional[int]]:
     """
     Return the host-port pair from a netloc.
     """
-    url = build_url_from_netloc(netloc)
-    parsed = urllib.parse.urlparse(url)
-    return parsed.hostname, parsed.port
+    # follows urlparse(build_url_from_netloc(netloc)).hostname/.port without
+    # building and parsing a throwaway URL
+    if netloc.count(":") >= 2 and "@" not in netloc and "[" not in netloc:
+        # bare IPv6 address, bracketed as in build_url_from_netloc()
+        netloc = f"[{netloc}]"
+    if ("[" in netloc) != ("]" in netloc):
+        raise ValueError("Invalid IPv6 URL")
+    hostinfo = netloc.rpartition("@")[2]
+    if "[" in netloc:
+        # urlsplit() validates the first bracketed part, even in the userinfo
+        _check_bracketed_host(netloc.partition("[")[2].partition("]")[0])
+        _, have_open_br, bracketed = hostinfo.partition("[")
+        if have_open_br:
+            host, _, rest = bracketed.partition("]")
+            port_str = rest.partition(":")[2]
+        else:
+            host, _, port_str = hostinfo.partition(":")
+    else:
+        host, _, port_str = hostinfo.partition(":")
+    port = None
+    if port_str:
+        if not (port_str.isascii() and port_str.isdigit()):
+            raise ValueError(f"Port could not be cast to integer value as {port_str!r}")
+        port = int(port_str)
+        if not 0 <= port <= 65535:
+            raise ValueError("Port out of range 0-65535")
+    if not host:
+        return None, port
+    host, percent, zone = host.partition("%")
+    return host.lower() + percent + zone, port
 
 
 def split_auth_from_netloc(netloc: str) -> NetlocTuple:
@@ -536,11 +673,16 @@ def remove_auth_from_url(url: str) -> str:
     """Return a copy of url with 'username:password@' removed."""
     # username/pass params are passed to subversion through flags
     # and are not recognized in the url.
+    if "@" not in url:
+        # nothing to strip, skip the urlsplit/urlunsplit round-trip
+        return url
     return _transform_url(url, _get_netloc)[0]
 
 
 def redact_auth_from_url(url: str) -> str:
     """Replace the password in a given url with ****."""
+    if "@" not in url:
+        return url
     return _transform_url(url, _redact_netloc)[0]
 
 
@@ -582,12 +724,17 @@ def is_console_interactive() -> bool:
 def hash_file(path: str, blocksize: int = 1 << 20) -> Tuple[Any, int]:
     """Return (hash, length) for path using hashlib.sha256()"""
 
-    h = hashlib.sha256()
-    length = 0
     with open(path, "rb") as f:
-        for block in read_chunks(f, size=blocksize):
-            length += len(block)
-            h.update(block)
+        if sys.version_info >= (3, 11):
+            # the read/update loop runs in C
+            h = hashlib.file_digest(f, "sha256")
+            length = f.tell()
+        else:
+            h = hashlib.sha256()
+            length = 0
+            for block in read_chunks(f, size=blocksize):
+                length += len(block)
+                h.update(block)
     return h, length
 
 
@@ -597,9 +744,11 @@ def pairwise(iterable: Iterable[Any]) -> Iterator[Tuple[Any, Any]]:
 
     For example:
         s -> (s0, s1), (s2, s3), (s4, s5), ...
+
+    A trailing unpaired element is dropped.
     """
     iterable = iter(iterable)
-    return zip_longest(iterable, iterable)
+    return zip(iterable, iterable)
 
 
 def partition(
@@ -611,9 +760,14 @@ def partition(
     like
 
         partition(is_odd, range(10)) --> 0 2 4 6 8   and  1 3 5 7 9
+
+    The input is consumed eagerly, calling pred once per entry.
     """
-    t1, t2 = tee(iterable)
-    return filterfalse(pred, t1), filter(pred, t2)
+    true_entries: List[T] = []
+    false_entries: List[T] = []
+    for entry in iterable:
+        (true_entries if pred(entry) else false_entries).append(entry)
+    return false_entries, true_entries
 
 
 # FIXME: generic file type?
@@ -681,7 +835,17 @@ def unfrackpath(path, follow=True, basedir=None):
     elif os.path.isfile(basedir):
         basedir = os.path.dirname(basedir)
 
-    b_final_path = os.path.expanduser(os.path.expandvars(path))
+    # only pay for expansion when there is something to expand
+    # ('%VAR%' is the Windows form)
+    if isinstance(path, bytes):
+        dollar, percent, tilde = b"$", b"%", b"~"
+    else:
+        dollar, percent, tilde = "$", "%", "~"
+    b_final_path = path
+    if dollar in b_final_path or percent in b_final_path:
+        b_final_path = os.path.expandvars(b_final_path)
+    if b_final_path.startswith(tilde):
+        b_final_path = os.path.expanduser(b_final_path)
 
     if not os.path.isabs(b_final_path):
         b_final_path = os.path.join(basedir, b_final_path)
@@ -711,18 +875,14 @@ def makedirs_safe(path, mode=None):
     """
 
     rpath = unfrackpath(path)
-    b_rpath = bytes(rpath)
-    if not os.path.exists(b_rpath):
-        try:
-            if mode:
-                os.makedirs(b_rpath, mode)
-            else:
-                os.makedirs(b_rpath)
-        except OSError as e:
-            if e.errno != errno.EEXIST:
-                raise AppError(
-                    "Unable to create local directories(%s): %s" % (rpath, e)
-                )
+    try:
+        if mode:
+            os.makedirs(rpath, mode, exist_ok=True)
+        else:
+            os.makedirs(rpath, exist_ok=True)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise AppError("Unable to create local directories(%s): %s" % (rpath, e))
 
 
 def cleanup_tmp_file(path, warn=False):
@@ -735,13 +895,14 @@ def cleanup_tmp_file(path, warn=False):
         cannot be removed
     """
     try:
-        if os.path.exists(path):
-            try:
-                if os.path.isdir(path):
-                    shutil.rmtree(path)
-                elif os.path.isfile(path):
-                    os.unlink(path)
-            except Exception:
-                pass
+        # a single lstat tells us whether it exists and what it is
+        st_mode = os.lstat(path).st_mode
+    except OSError:
+        return
+    try:
+        if stat.S_ISDIR(st_mode):
+            shutil.rmtree(path, ignore_errors=True)
+        elif stat.S_ISREG(st_mode) or stat.S_ISLNK(st_mode):
+            os.unlink(path)
     except Exception:
         pass